@@ -21,6 +21,7 @@ import voluptuous as vol
 from .api import ZoomAPI
 from .common import (
     ZoomOAuth2Implementation,
+    ZoomPresenceDataUpdateCoordinator,
     ZoomUserProfileDataUpdateCoordinator,
     ZoomWebhookRequestView,
     valid_external_url,
@@ -33,6 +34,7 @@ from .const import (
     DOMAIN,
     OAUTH2_AUTHORIZE,
     OAUTH2_TOKEN,
+    PRESENCE_COORDINATOR,
     USER_PROFILE_COORDINATOR,
     ZOOM_SCHEMA,
 )
@@ -147,8 +149,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
         remove_verification_token_from_entry(hass, entry)
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN].setdefault(entry.entry_id, {})
+    entry_data = hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {})
     try:
         implementation = (
             await config_entry_oauth2_flow.async_get_config_entry_implementation(
@@ -171,8 +172,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     api = ZoomAPI(config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation))
     coordinator = ZoomUserProfileDataUpdateCoordinator(hass, api)
     await coordinator.async_refresh()
-    hass.data[DOMAIN][entry.entry_id][USER_PROFILE_COORDINATOR] = coordinator
-    hass.data[DOMAIN][entry.entry_id][API] = api
+    presence_coordinator = ZoomPresenceDataUpdateCoordinator(hass, api)
+    entry_data[USER_PROFILE_COORDINATOR] = coordinator
+    entry_data[API] = api
+    entry_data[PRESENCE_COORDINATOR] = presence_coordinator
 
     try:
         my_profile = await api.async_get_my_user_profile()
@@ -1,19 +1,31 @@
 """API for Zoom Automation bound to Home Assistant OAuth."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
 import logging
 from typing import Any
 
 from aiohttp.web import HTTPUnauthorized
 from homeassistant.helpers import config_entry_oauth2_flow
 
-from .const import BASE_URL, CONTACT_LIST_URL, USER_PROFILE_URL
+from .const import (
+    BASE_URL,
+    CONTACT_LIST_URL,
+    MAX_PARALLEL_REQUESTS,
+    USER_PROFILE_URL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class ZoomAPI:
-    """Provide Zoom Automation authentication tied to an OAuth2 based config entry."""
+    """Provide Zoom Automation authentication tied to an OAuth2 based config entry.
+
+    All requests are made through the OAuth2 session, which uses Home Assistant's
+    shared aiohttp client session, so connections are kept alive and reused across
+    polls instead of opening a new session per request.
+    """
 
     def __init__(self, oauth_session: config_entry_oauth2_flow.OAuth2Session) -> None:
         """Initialize Zoom auth."""
@@ -42,6 +54,35 @@ class ZoomAPI:
         )
         return await resp.json()
 
+    async def async_get_bulk_presence(
+        self, ids: Iterable[str]
+    ) -> dict[str, dict[str, str]]:
+        """Get presence status for all users with given IDs, keyed by ID.
+
+        Users whose lookup fails are left out so one bad ID doesn't fail the batch.
+        """
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_REQUESTS)
+
+        async def _async_get_profile(id: str) -> dict[str, str]:
+            async with semaphore:
+                return await self.async_get_contact_user_profile(id)
+
+        ids = list(ids)
+        results = await asyncio.gather(
+            *(_async_get_profile(id) for id in ids), return_exceptions=True
+        )
+
+        profiles = {}
+        for id, result in zip(ids, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                _LOGGER.debug("Unable to get presence status for %s: %s", id, result)
+                continue
+            profiles[id] = result
+
+        return profiles
+
     async def async_get_contacts(
         self, contact_types: list[str] = ["external"], limit: int = None
     ) -> list[dict[str, str]]:
@@ -1,28 +1,33 @@
 """Sensor platform for Zoom."""
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
+from functools import lru_cache
 from logging import getLogger
+import sys
 from typing import Any
 
-from aiohttp.web import HTTPUnauthorized
+from aiohttp import ClientError
+from aiohttp.client_exceptions import ClientResponseError
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ID, CONF_NAME
-from homeassistant.core import Event
-from homeassistant.helpers.dispatcher import (
-    async_dispatcher_connect,
-    async_dispatcher_send,
-)
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.util import slugify
 
-from .common import ZoomAPI, ZoomUserProfileDataUpdateCoordinator, get_contact_name
+from .common import (
+    ZoomAPI,
+    ZoomPresenceDataUpdateCoordinator,
+    ZoomUserProfileDataUpdateCoordinator,
+    get_contact_name,
+)
 from .const import (
     API,
     ATTR_EVENT,
@@ -32,14 +37,21 @@ from .const import (
     CONNECTIVITY_STATUS,
     DEFAULT_CONNECTIVITY_ON_STATUSES,
     DOMAIN,
-    HA_ZOOM_EVENT,
+    HA_ZOOM_EVENT_SIGNAL,
+    PRESENCE_COORDINATOR,
     USER_PROFILE_COORDINATOR,
 )
 
 _LOGGER = getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=30)
-PARALLEL_UPDATES = 5
+PARALLEL_UPDATES = 0
+
+# Contact sensors of an entry share its name, so only slugify it once
+_slugify_cached = lru_cache(maxsize=512)(slugify)
+
+# Profile keys exposed as state attributes
+_PROFILE_ATTRIBUTES = ("first_name", "last_name", "email", "account_id")
 
 
 async def async_setup_entry(
@@ -56,10 +68,15 @@ async def async_setup_entry(
     async_add_entities([entity], update_before_add=True)
 
 
-def get_data_from_path(data: dict[str, Any], path: list[str]) -> str | None:
-    """Get value from dictionary using path list."""
-    for val in path:
-        data = data.get(val, {})
+_MISSING = object()
+
+
+def get_data_from_path(data: dict[str, Any], path: tuple[str, ...]) -> str | None:
+    """Get value from dictionary using path tuple."""
+    for key in path:
+        data = data.get(key, _MISSING)
+        if data is _MISSING:
+            return None
 
     if isinstance(data, str):
         return data
@@ -69,65 +86,81 @@ def get_data_from_path(data: dict[str, Any], path: list[str]) -> str | None:
 class ZoomBaseBinarySensor(RestoreEntity, BinarySensorEntity):
     """Base class for Zoom binary_sensor."""
 
+    __slots__ = (
+        "_config_entry",
+        "_hass",
+        "_coordinator",
+        "_api",
+        "_presence_coordinator",
+        "_name",
+        "_entry_id_value",
+        "_profile",
+        "_zoom_event_state",
+        "_is_on",
+        "_id_lower",
+        "_cached_attrs",
+        "_on_statuses",
+    )
+
+    # Whether every presence poll should update the state, or only the poll that
+    # follows a loss of connectivity to Zoom.
+    _sync_state_on_poll = False
+
     def __init__(self, hass: HomeAssistantType, config_entry: ConfigEntry) -> None:
         """Initialize base sensor."""
         self._config_entry = config_entry
         self._hass = hass
-        self._coordinator: ZoomUserProfileDataUpdateCoordinator = hass.data[DOMAIN][
-            config_entry.entry_id
-        ][USER_PROFILE_COORDINATOR]
-        self._api: ZoomAPI = hass.data[DOMAIN][config_entry.entry_id][API]
+        entry_data = hass.data[DOMAIN][config_entry.entry_id]
+        self._coordinator: ZoomUserProfileDataUpdateCoordinator = entry_data[
+            USER_PROFILE_COORDINATOR
+        ]
+        self._api: ZoomAPI = entry_data[API]
+        self._presence_coordinator: ZoomPresenceDataUpdateCoordinator = entry_data[
+            PRESENCE_COORDINATOR
+        ]
         self._name: str = config_entry.data[CONF_NAME]
+        self._entry_id_value: str | None = config_entry.data.get(CONF_ID)
         self._profile = None
         self._zoom_event_state = None
         self._is_on = False
+        self._id_lower: str | None = None
+        self._cached_attrs: dict[str, Any] | None = None
+        self._on_statuses = self._get_on_statuses()
 
         self._attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
-        self._attr_unique_id = f"{DOMAIN}_{slugify(self._name)}"
+        self._attr_unique_id = f"{DOMAIN}_{_slugify_cached(self._name)}"
         self._attr_available = True
         self._attr_should_poll = False
 
-    async def _async_update(self, now) -> None:
-        """Update state of entity."""
-        if self.id:
-            try:
-                self._profile = await self._api.async_get_contact_user_profile(self.id)
-                # If API call succeeds but we are unavailable, that means we just regained
-                # connectivity to Zoom so we should do a single poll to update status.
-                if not self._attr_available:
-                    _LOGGER.info(
-                        "We can reach Zoom again, polling for current status in case "
-                        "we missed updates"
-                    )
-                    self._set_state(self._profile["presence_status"])
-                    self._attr_available = True
-                    self.async_write_ha_state()
-            except:
-                # If API call fails we can assume we can't talk to Zoom
-                if self._attr_available:
-                    _LOGGER.warning(
-                        "Unable to reach Zoom, we may miss status updates until we "
-                        "can connect again"
-                    )
-                    self._attr_available = False
-                    self.async_write_ha_state()
-
     async def _restore_state(self) -> None:
         """Restore state from last known state."""
+        # A status already received from Zoom is more current than the recorder
+        if self._zoom_event_state is not None:
+            return
+
         restored_state = await self.async_get_last_state()
         if restored_state:
             self._is_on = restored_state.state
 
-    @staticmethod
-    async def _async_send_update_options_signal(
-        hass: HomeAssistantType, config_entry: ConfigEntry
-    ) -> None:
-        """Send update event when Zoom config entry is updated."""
-        async_dispatcher_send(hass, config_entry.entry_id)
+    def _get_on_statuses(self) -> frozenset[str]:
+        """Return the set of Zoom statuses that map to an on state."""
+        return frozenset(
+            sys.intern(status)
+            for status in self._config_entry.options.get(
+                CONF_CONNECTIVITY_ON_STATUSES, DEFAULT_CONNECTIVITY_ON_STATUSES
+            )
+        )
 
-    async def _async_update_options(self) -> None:
-        """Update options if the update signal comes from this entity."""
-        self.async_write_ha_state()
+    async def _async_update_options(
+        self, hass: HomeAssistantType, config_entry: ConfigEntry
+    ) -> None:
+        """Update options when the Zoom config entry is updated."""
+        self._on_statuses = self._get_on_statuses()
+        # Without a known Zoom status the state was restored, so leave it as is
+        if self._zoom_event_state is not None and self._set_state(
+            self._zoom_event_state
+        ):
+            self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added."""
@@ -135,64 +168,124 @@ class ZoomBaseBinarySensor(RestoreEntity, BinarySensorEntity):
 
         # Register callback for when config entry is updated.
         self.async_on_remove(
-            self._config_entry.add_update_listener(
-                self._async_send_update_options_signal
-            )
-        )
-
-        # Register callback for update event
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass, self._config_entry.entry_id, self._async_update_options
-            )
+            self._config_entry.add_update_listener(self._async_update_options)
         )
 
         # Update state when coordinator updates
         self.async_on_remove(
-            self._coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-        # Manually set an update interval so we can disable it if needed
-        self.async_on_remove(
-            async_track_time_interval(
-                self._hass, self._async_update, timedelta(seconds=30)
-            )
+            self._coordinator.async_add_listener(self._async_profile_updated)
         )
 
+        self._async_track_id()
         if self.id:
             try:
                 self._profile = await self._api.async_get_contact_user_profile(self.id)
+                self._cached_attrs = None
                 status = self._profile["presence_status"]
                 _LOGGER.debug("Retrieved initial Zoom status: %s", status)
                 self._set_state(status)
                 self.async_write_ha_state()
-            except HTTPUnauthorized:
-                _LOGGER.debug(
-                    "User is unauthorized to query presence status, restoring state.",
-                    exc_info=True,
-                )
-                await self._restore_state()
-            except:
-                _LOGGER.warning(
-                    "Error retrieving initial zoom status, restoring state.",
-                    exc_info=True,
-                )
+            except (ClientError, asyncio.TimeoutError, KeyError, ValueError) as err:
+                if isinstance(err, ClientResponseError) and err.status == 401:
+                    _LOGGER.debug(
+                        "User is unauthorized to query presence status, restoring "
+                        "state."
+                    )
+                else:
+                    _LOGGER.warning(
+                        "Error retrieving initial zoom status, restoring state: %s",
+                        err,
+                    )
                 await self._restore_state()
         else:
             _LOGGER.debug("ID is unknown, restoring state.")
             await self._restore_state()
 
-    def _set_state(self, zoom_event_state: str | None) -> None:
-        """Set Zoom and HA state."""
-        self._zoom_event_state = zoom_event_state
-        self._is_on = (
-            self._zoom_event_state
-            and self._zoom_event_state
-            in self._config_entry.options[CONF_CONNECTIVITY_ON_STATUSES]
+    @callback
+    def _async_track_id(self) -> None:
+        """Start matching webhooks and polling presence once the ID is known."""
+        if self._id_lower is not None or not (id := self.id):
+            return
+
+        self._id_lower = id.lower()
+
+        # Presence for all users is polled in a single batch by the coordinator
+        self.async_on_remove(self._presence_coordinator.async_register_user(id))
+        self.async_on_remove(
+            self._presence_coordinator.async_add_listener(self._async_presence_updated)
         )
+
+    @callback
+    def _async_presence_updated(self) -> None:
+        """Update entity from the latest batched presence poll."""
+        self._async_track_id()
+        if (
+            not self._presence_coordinator.last_update_success
+            or (profile := self._presence_coordinator.data.get(self.id)) is None
+        ):
+            # If API call fails we can assume we can't talk to Zoom
+            if self._attr_available:
+                _LOGGER.warning(
+                    "Unable to reach Zoom, we may miss status updates until we "
+                    "can connect again"
+                )
+                self._attr_available = False
+                self.async_write_ha_state()
+            return
+
+        # If API call succeeds but we are unavailable, that means we just regained
+        # connectivity to Zoom so we should use this poll to update status.
+        changed = regained = not self._attr_available
+        if regained:
+            _LOGGER.info(
+                "We can reach Zoom again, polling for current status in case "
+                "we missed updates"
+            )
+            self._attr_available = True
+
+        # Only profile keys shown as attributes matter, the presence status is
+        # handled by _set_state
+        old_profile = self.profile
+        self._profile = profile
+        if any(
+            profile.get(key) != old_profile.get(key)
+            for key in ("id", *_PROFILE_ATTRIBUTES)
+        ):
+            self._cached_attrs = None
+            changed = True
+
+        if (regained or self._sync_state_on_poll) and self._set_state(
+            profile.get("presence_status")
+        ):
+            changed = True
+
+        if changed:
+            self.async_write_ha_state()
+
+    @callback
+    def _async_profile_updated(self) -> None:
+        """Write state after the user profile coordinator updates."""
+        self._async_track_id()
+        self._cached_attrs = None
+        self.async_write_ha_state()
+
+    def _set_state(self, zoom_event_state: str | None) -> bool:
+        """Set Zoom and HA state and return whether either of them changed."""
+        # Statuses come from a small closed set, so interning them lets the
+        # membership and equality checks below short-circuit on identity.
+        if zoom_event_state:
+            zoom_event_state = sys.intern(zoom_event_state)
+        is_on = bool(zoom_event_state and zoom_event_state in self._on_statuses)
+        if zoom_event_state == self._zoom_event_state and is_on == self._is_on:
+            return False
+
+        self._zoom_event_state = zoom_event_state
+        self._is_on = is_on
+        self._cached_attrs = None
         _LOGGER.debug(
             "Set Zoom state to %s and HA state to %s", zoom_event_state, self._is_on
         )
+        return True
 
     @property
     def is_on(self) -> bool:
@@ -224,7 +317,7 @@ class ZoomBaseBinarySensor(RestoreEntity, BinarySensorEntity):
     @property
     def id(self) -> str | None:
         """Return the id."""
-        return self._config_entry.data.get(CONF_ID) or self.profile.get("id")
+        return self._entry_id_value or self.profile.get("id")
 
     @property
     def email(self) -> str | None:
@@ -239,44 +332,59 @@ class ZoomBaseBinarySensor(RestoreEntity, BinarySensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        data = {}
+        if self._cached_attrs is not None:
+            return self._cached_attrs or None
 
-        for prop in ["id", "first_name", "last_name", "email", "account_id"]:
-            val = getattr(self, prop)
-            if val:
-                data[prop] = val
+        profile = self.profile
+        data = {}
 
+        if id := self.id:
+            data["id"] = id
+        for key in _PROFILE_ATTRIBUTES:
+            if val := profile.get(key):
+                data[key] = val
         if self._zoom_event_state:
             data["status"] = self._zoom_event_state
 
+        self._cached_attrs = data
         return data if data else None
 
 
 class ZoomAuthenticatedUserBinarySensor(ZoomBaseBinarySensor):
     """Class for Zoom user profile binary sensor for authenticated user."""
 
+    __slots__ = ()
+
     def __init__(self, hass: HomeAssistantType, config_entry: ConfigEntry) -> None:
         """Initialize Zoom user profile binary sensor for authenticated user."""
         super().__init__(hass, config_entry)
         self._attr_name = f"Zoom - {self._name}"
 
-    async def async_event_received(self, event: Event) -> None:
+    @callback
+    def async_event_received(self, status: dict[str, Any]) -> None:
         """Update status if event received for this entity."""
-        status = event.data
-        if (
-            status["ha_config_entry_id"] == self._config_entry.entry_id
-            and status[ATTR_EVENT] == CONNECTIVITY_EVENT
-            and get_data_from_path(status, CONNECTIVITY_ID).lower() == self.id.lower()
-        ):
-            self._set_state(get_data_from_path(status, CONNECTIVITY_STATUS))
+        if status.get(ATTR_EVENT) != CONNECTIVITY_EVENT:
+            return
+
+        user_id = get_data_from_path(status, CONNECTIVITY_ID)
+        if user_id is None or user_id.lower() != self._id_lower:
+            return
+
+        if self._set_state(get_data_from_path(status, CONNECTIVITY_STATUS)):
             self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added."""
         await super().async_added_to_hass()
-        # Register callback for webhook event
+
+        # Register callback for webhook events sent to this config entry. Only the
+        # authenticated user receives webhook events, contacts are polled instead.
         self.async_on_remove(
-            self.hass.bus.async_listen(f"{HA_ZOOM_EVENT}", self.async_event_received)
+            async_dispatcher_connect(
+                self.hass,
+                HA_ZOOM_EVENT_SIGNAL.format(self._config_entry.entry_id),
+                self.async_event_received,
+            )
         )
 
     @property
@@ -293,6 +401,10 @@ class ZoomAuthenticatedUserBinarySensor(ZoomBaseBinarySensor):
 class ZoomContactUserBinarySensor(ZoomBaseBinarySensor):
     """Class for Zoom user profile binary sensor for contacts of authenticated user."""
 
+    __slots__ = ("_id",)
+
+    _sync_state_on_poll = True
+
     def __init__(
         self, hass: HomeAssistantType, config_entry: ConfigEntry, id: str
     ) -> None:
@@ -301,10 +413,12 @@ class ZoomContactUserBinarySensor(ZoomBaseBinarySensor):
         self._id = id
 
         self._attr_unique_id = f"{super().unique_id}_{id}"
-        self._attr_should_poll = True
-        self._attr_name = (
-            f"Zoom - {self._name}'s Contact - {get_contact_name(self.profile)}"
-        )
+
+    @property
+    def name(self) -> str:
+        """Return the name of the entity once the contact profile is known."""
+        contact_name = get_contact_name(self._profile) if self._profile else self._id
+        return f"Zoom - {self._name}'s Contact - {contact_name}"
 
     @property
     def id(self) -> str | None:
@@ -11,8 +11,9 @@ from typing import Any
 from aiohttp.web import Request, Response, json_response
 from homeassistant.components.http.view import HomeAssistantView
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.network import NoURLAvailableError, get_url
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
@@ -24,6 +25,7 @@ from .const import (
     DOMAIN,
     HA_URL,
     HA_ZOOM_EVENT,
+    HA_ZOOM_EVENT_SIGNAL,
     VALIDATION_EVENT,
     WEBHOOK_RESPONSE_SCHEMA,
 )
@@ -183,8 +185,11 @@ class ZoomWebhookRequestView(HomeAssistantView):
                 entry.entry_id,
                 status,
             )
-            hass.bus.async_fire(
-                f"{HA_ZOOM_EVENT}", {**status, "ha_config_entry_id": entry.entry_id}
+            event_data = {**status, "ha_config_entry_id": entry.entry_id}
+            hass.bus.async_fire(HA_ZOOM_EVENT, event_data)
+            # Only wake up the entities belonging to the matching config entry
+            async_dispatcher_send(
+                hass, HA_ZOOM_EVENT_SIGNAL.format(entry.entry_id), event_data
             )
             return Response(status=HTTPStatus.OK)
 
@@ -244,3 +249,40 @@ class ZoomContactlistDataUpdateCoordinator(DataUpdateCoordinator):
             return await self._api.async_get_contacts(self._contact_types)
         except Exception as err:
             raise UpdateFailed from err
+
+
+class ZoomPresenceDataUpdateCoordinator(DataUpdateCoordinator):
+    """Define an object to poll Zoom presence status for all registered users."""
+
+    def __init__(self, hass: HomeAssistant, api: ZoomAPI) -> None:
+        """Initialize."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(seconds=30),
+            update_method=self._async_update_data,
+        )
+        self._api = api
+        self.user_ids: set[str] = set()
+
+    @callback
+    def async_register_user(self, id: str) -> CALLBACK_TYPE:
+        """Poll presence for user with given ID and return an unregister callback."""
+        self.user_ids.add(id)
+
+        @callback
+        def _unregister() -> None:
+            self.user_ids.discard(id)
+
+        return _unregister
+
+    async def _async_update_data(self) -> dict[str, dict[str, str]]:
+        """Update data via library."""
+        if not self.user_ids:
+            return {}
+
+        try:
+            return await self._api.async_get_bulk_presence(self.user_ids)
+        except Exception as err:
+            raise UpdateFailed from err
@@ -20,6 +20,10 @@ USER_PROFILE_URL = "users/me"
 USER_PROFILE_COORDINATOR = "user_profile_coordinator"
 CONTACT_LIST_URL = "chat/users/me/contacts"
 CONTACT_LIST_COORDINATOR = "contact_list_coordinator"
+# Cap concurrent presence requests so a batch poll reuses a few keep-alive
+# connections instead of opening one per user
+MAX_PARALLEL_REQUESTS = 5
+PRESENCE_COORDINATOR = "presence_coordinator"
 
 ZOOM_SCHEMA = vol.Schema(
     {
@@ -39,8 +43,8 @@ ATTR_ID = "id"
 ATTR_CONNECTIVITY_STATUS = "presence_status"
 
 CONNECTIVITY_EVENT = "user.presence_status_updated"
-CONNECTIVITY_STATUS = [ATTR_PAYLOAD, ATTR_OBJECT, ATTR_CONNECTIVITY_STATUS]
-CONNECTIVITY_ID = [ATTR_PAYLOAD, ATTR_OBJECT, ATTR_ID]
+CONNECTIVITY_STATUS = (ATTR_PAYLOAD, ATTR_OBJECT, ATTR_CONNECTIVITY_STATUS)
+CONNECTIVITY_ID = (ATTR_PAYLOAD, ATTR_OBJECT, ATTR_ID)
 
 VALIDATION_EVENT = "endpoint.url_validation"
 
@@ -57,6 +61,8 @@ ALL_CONNECTIVITY_STATUSES = [
 DEFAULT_CONNECTIVITY_ON_STATUSES = ["In_Meeting", "Presenting", "On_Phone_Call"]
 
 HA_ZOOM_EVENT = f"{DOMAIN}_webhook"
+# Dispatcher signal for webhook events, formatted with the config entry ID
+HA_ZOOM_EVENT_SIGNAL = f"{HA_ZOOM_EVENT}_{{}}"
 
 WEBHOOK_RESPONSE_SCHEMA = vol.Schema(
     {
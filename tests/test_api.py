@@ -1,7 +1,9 @@
 """Test zoom API."""
 from http import HTTPStatus
 
-from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET
+from aiohttp import ClientError
+from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET, CONF_NAME
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_entry_oauth2_flow
 from pytest_homeassistant_custom_component.async_mock import patch
 from pytest_homeassistant_custom_component.test_util.aiohttp import (
@@ -20,8 +22,8 @@ from custom_components.zoom.const import (
 from .const import MOCK_ENTRY, MOCK_TOKEN
 
 
-async def test_api(hass):
-    """Test API."""
+def _get_api(hass: HomeAssistant) -> ZoomAPI:
+    """Add the mock config entry and return an API bound to it."""
     MOCK_ENTRY.add_to_hass(hass)
     implementation = ZoomOAuth2Implementation(
         hass,
@@ -31,11 +33,17 @@ async def test_api(hass):
         OAUTH2_AUTHORIZE,
         OAUTH2_TOKEN,
         MOCK_ENTRY.data[CONF_SECRET_TOKEN],
+        MOCK_ENTRY.data[CONF_NAME],
     )
-    api = ZoomAPI(
+    return ZoomAPI(
         config_entry_oauth2_flow.OAuth2Session(hass, MOCK_ENTRY, implementation)
     )
 
+
+async def test_api(hass):
+    """Test API."""
+    api = _get_api(hass)
+
     assert await api.async_get_access_token() == MOCK_TOKEN
 
     with patch(
@@ -73,3 +81,40 @@ async def test_api(hass):
         ),
     ):
         await api.async_get_my_user_profile()
+
+
+async def test_api_bulk_presence(hass):
+    """Test batched presence lookup."""
+    api = _get_api(hass)
+
+    with patch(
+        "homeassistant.helpers.config_entry_oauth2_flow.OAuth2Session.async_request",
+        return_value=AiohttpClientMockResponse(
+            "get",
+            "zoom_url",
+            status=HTTPStatus.OK,
+            json={"id": "test", "presence_status": "Available"},
+        ),
+    ):
+        assert await api.async_get_bulk_presence(["test"]) == {
+            "test": {"id": "test", "presence_status": "Available"}
+        }
+
+
+async def test_api_bulk_presence_partial_failure(hass):
+    """Test a failed lookup for one user doesn't fail the whole batch."""
+    api = _get_api(hass)
+
+    async def _get_contact_user_profile(id):
+        if id == "bad":
+            raise ClientError("Not Found")
+        return {"id": id, "presence_status": "Available"}
+
+    with patch(
+        "custom_components.zoom.api.ZoomAPI.async_get_contact_user_profile",
+        side_effect=_get_contact_user_profile,
+    ):
+        assert await api.async_get_bulk_presence(["test", "bad", "other"]) == {
+            "test": {"id": "test", "presence_status": "Available"},
+            "other": {"id": "other", "presence_status": "Available"},
+        }
@@ -0,0 +1,193 @@
+"""Test zoom binary sensor."""
+import hashlib
+import hmac
+from http import HTTPStatus
+import json
+
+from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.setup import async_setup_component
+from pytest import fixture
+from pytest_homeassistant_custom_component.async_mock import (
+    AsyncMock,
+    MagicMock,
+    patch,
+)
+
+from custom_components.zoom.binary_sensor import ZoomAuthenticatedUserBinarySensor
+from custom_components.zoom.common import ZoomPresenceDataUpdateCoordinator
+from custom_components.zoom.const import (
+    CONF_SECRET_TOKEN,
+    DOMAIN,
+    HA_URL,
+    HA_ZOOM_EVENT,
+    HA_ZOOM_EVENT_SIGNAL,
+    PRESENCE_COORDINATOR,
+)
+
+from .const import MOCK_ENTRY
+
+ENTITY_ID = "binary_sensor.zoom_test"
+
+MOCK_PROFILE = {
+    "id": "test",
+    "first_name": "test",
+    "email": "test@example.com",
+    "presence_status": "Available",
+}
+
+
+@fixture(name="presence_coordinator")
+async def presence_coordinator_fixture(hass: HomeAssistant):
+    """Set up the mock config entry and return its presence coordinator."""
+    MOCK_ENTRY.add_to_hass(hass)
+    with patch(
+        "custom_components.zoom.api.ZoomAPI.async_get_contact_user_profile",
+        return_value=MOCK_PROFILE,
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+
+    yield hass.data[DOMAIN][MOCK_ENTRY.entry_id][PRESENCE_COORDINATOR]
+
+    assert await MOCK_ENTRY.async_unload(hass)
+    await hass.async_block_till_done()
+
+
+async def _async_poll(
+    coordinator: ZoomPresenceDataUpdateCoordinator, data: dict[str, dict[str, str]]
+) -> None:
+    """Run a presence poll that returns the given data."""
+    with patch(
+        "custom_components.zoom.api.ZoomAPI.async_get_bulk_presence",
+        return_value=data,
+    ):
+        await coordinator.async_refresh()
+
+
+async def test_presence_coordinator_register_user(hass: HomeAssistant) -> None:
+    """Test registering and unregistering users with the presence coordinator."""
+    coordinator = ZoomPresenceDataUpdateCoordinator(hass, MagicMock())
+
+    unregister = coordinator.async_register_user("test")
+    assert coordinator.user_ids == {"test"}
+
+    unregister()
+    assert coordinator.user_ids == set()
+
+
+async def test_presence_coordinator_no_users(hass: HomeAssistant) -> None:
+    """Test the presence coordinator skips the API when no users are registered."""
+    api = MagicMock()
+    api.async_get_bulk_presence = AsyncMock()
+    coordinator = ZoomPresenceDataUpdateCoordinator(hass, api)
+
+    await coordinator.async_refresh()
+
+    assert coordinator.data == {}
+    api.async_get_bulk_presence.assert_not_called()
+
+
+async def test_sensor_registers_with_presence_coordinator(
+    hass: HomeAssistant, presence_coordinator: ZoomPresenceDataUpdateCoordinator
+) -> None:
+    """Test the authenticated user sensor is polled by the presence coordinator."""
+    assert presence_coordinator.user_ids == {"test"}
+    assert hass.states.get(ENTITY_ID).state == STATE_OFF
+
+
+async def test_sensor_availability_follows_poll(
+    hass: HomeAssistant, presence_coordinator: ZoomPresenceDataUpdateCoordinator
+) -> None:
+    """Test the sensor goes unavailable when left out of a poll and resyncs after."""
+    await _async_poll(presence_coordinator, {})
+    assert hass.states.get(ENTITY_ID).state == STATE_UNAVAILABLE
+
+    # Regaining connectivity resyncs the state from the poll
+    await _async_poll(
+        presence_coordinator,
+        {"test": {**MOCK_PROFILE, "presence_status": "In_Meeting"}},
+    )
+    state = hass.states.get(ENTITY_ID)
+    assert state.state == STATE_ON
+    assert state.attributes["status"] == "In_Meeting"
+
+
+async def test_sensor_skips_unchanged_poll_writes(
+    hass: HomeAssistant, presence_coordinator: ZoomPresenceDataUpdateCoordinator
+) -> None:
+    """Test the authenticated user sensor only writes state when a poll changes it."""
+    await _async_poll(presence_coordinator, {"test": MOCK_PROFILE})
+
+    with patch.object(
+        ZoomAuthenticatedUserBinarySensor, "async_write_ha_state"
+    ) as write_state:
+        # The webhook drives the state, so a new status from a poll is ignored
+        await _async_poll(
+            presence_coordinator,
+            {"test": {**MOCK_PROFILE, "presence_status": "In_Meeting"}},
+        )
+        write_state.assert_not_called()
+
+        # Profile changes shown as attributes are written
+        await _async_poll(
+            presence_coordinator,
+            {"test": {**MOCK_PROFILE, "email": "new@example.com"}},
+        )
+        write_state.assert_called_once()
+
+    assert hass.states.get(ENTITY_ID).state == STATE_OFF
+
+
+async def test_webhook_event_routed_to_entry(
+    hass: HomeAssistant,
+    hass_client,
+    presence_coordinator: ZoomPresenceDataUpdateCoordinator,
+) -> None:
+    """Test a signed webhook reaches only its entry's sensor and the bus."""
+    bus_events = []
+    hass.bus.async_listen(HA_ZOOM_EVENT, bus_events.append)
+    entry_signals = []
+    async_dispatcher_connect(
+        hass, HA_ZOOM_EVENT_SIGNAL.format(MOCK_ENTRY.entry_id), entry_signals.append
+    )
+    other_signals = []
+    async_dispatcher_connect(
+        hass, HA_ZOOM_EVENT_SIGNAL.format("other"), other_signals.append
+    )
+
+    text = json.dumps(
+        {
+            "event": "user.presence_status_updated",
+            "event_ts": 1,
+            "payload": {"object": {"id": "TEST", "presence_status": "In_Meeting"}},
+        }
+    )
+    timestamp = "1"
+    signature = hmac.new(
+        MOCK_ENTRY.data[CONF_SECRET_TOKEN].encode(),
+        f"v0:{timestamp}:{text}".encode(),
+        hashlib.sha256,
+    ).hexdigest()
+
+    client = await hass_client()
+    resp = await client.post(
+        HA_URL,
+        data=text,
+        headers={
+            "Content-Type": "application/json",
+            "x-zm-signature": f"v0={signature}",
+            "x-zm-request-timestamp": timestamp,
+        },
+    )
+    assert resp.status == HTTPStatus.OK
+    await hass.async_block_till_done()
+
+    # Automations built on the global bus event still get every webhook event
+    assert len(bus_events) == 1
+    assert bus_events[0].data["ha_config_entry_id"] == MOCK_ENTRY.entry_id
+
+    assert len(entry_signals) == 1
+    assert not other_signals
+    assert hass.states.get(ENTITY_ID).state == STATE_ON